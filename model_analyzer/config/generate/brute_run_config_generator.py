@@ -23,6 +23,9 @@
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
 )
+from model_analyzer.config.generate.perf_analyzer_config_generator import (
+    PerfAnalyzerConfigGenerator,
+)
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 from model_analyzer.config.run.run_config import RunConfig
@@ -82,12 +85,30 @@ def __init__(
 
         self._skip_default_config = skip_default_config
 
+        # Best throughput of each ModelRunConfig already profiled (keyed by its
+        # representation) across all visits, used to prune it when the walk
+        # revisits it, along with the measurements of its latest visit
+        self._pruning_threshold = config.run_config_search_pruning_threshold
+        self._max_throughput = 0.0
+        self._best_throughputs: List[Dict[str, float]] = [
+            {} for n in range(self._num_models)
+        ]
+        self._evaluated_results: List[
+            Dict[str, List[Optional[RunConfigMeasurement]]]
+        ] = [{} for n in range(self._num_models)]
+
     def set_last_results(
         self, measurements: List[Optional[RunConfigMeasurement]]
     ) -> None:
         for index in range(self._num_models):
             self._curr_results[index].extend(measurements)
 
+        for measurement in measurements:
+            self._max_throughput = max(
+                self._max_throughput,
+                PerfAnalyzerConfigGenerator.get_throughput(measurement),
+            )
+
     def get_configs(self) -> Generator[RunConfig, None, None]:
         """
         Returns
@@ -118,22 +139,66 @@ def _generate_subset(
 
         self._curr_generators[index] = mrcg
 
+        is_leaf_model = index == (self._num_models - 1)
+
         for model_run_config in mrcg.get_configs():
-            self._curr_model_run_configs[index] = model_run_config
+            key = model_run_config.representation()
 
-            if index == (len(self._models) - 1):
-                yield (self._make_run_config())
+            if self._should_prune(index, key):
+                self._replay_results(index, key)
             else:
-                yield from self._generate_subset(index + 1, default_only)
+                self._curr_model_run_configs[index] = model_run_config
+
+                if is_leaf_model:
+                    yield (self._make_run_config())
+                else:
+                    yield from self._generate_subset(index + 1, default_only)
+
+                self._record_evaluated_results(index, key)
 
             self._send_results_to_generator(index)
 
     def _make_run_config(self) -> RunConfig:
         run_config = RunConfig(self._triton_env, self._models[0].genai_perf_flags())
-        for index in range(len(self._models)):
-            run_config.add_model_run_config(self._curr_model_run_configs[index])
+        for model_run_config in self._curr_model_run_configs:
+            run_config.add_model_run_config(model_run_config)
         return run_config
 
+    def _should_prune(self, index: int, key: str) -> bool:
+        """
+        Returns true if this ModelRunConfig was already profiled earlier in the
+        walk and never reached the pruning threshold of the best throughput
+        """
+        if not self._pruning_threshold or key not in self._best_throughputs[index]:
+            return False
+
+        return (
+            self._best_throughputs[index][key]
+            < self._pruning_threshold * self._max_throughput
+        )
+
+    def _record_evaluated_results(self, index: int, key: str) -> None:
+        measurements = self._curr_results[index]
+
+        self._evaluated_results[index][key] = measurements
+        self._best_throughputs[index][key] = max(
+            [
+                PerfAnalyzerConfigGenerator.get_throughput(measurement)
+                for measurement in measurements
+            ]
+            + [self._best_throughputs[index].get(key, 0.0)]
+        )
+
+    def _replay_results(self, index: int, key: str) -> None:
+        """
+        Feeds the earlier measurements of a pruned ModelRunConfig back to its
+        own generator only, so that it keeps stepping as it did when the
+        config was profiled. The generators of the models before it receive
+        only fresh results, since these measurements were taken under
+        different configs of those models
+        """
+        self._curr_results[index].extend(self._evaluated_results[index][key])
+
     def _send_results_to_generator(self, index: int) -> None:
         self._curr_generators[index].set_last_results(self._curr_results[index])
         self._curr_results[index] = []
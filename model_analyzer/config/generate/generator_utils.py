@@ -14,8 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 from itertools import product
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class GeneratorUtils:
@@ -108,9 +109,15 @@ def generate_doubled_list(min_value: int, max_value: int) -> List[int]:
             The value that the generated list will not exceed
         """
 
-        list = []
+        # A fresh list is returned so that callers are free to mutate it
+        return list(GeneratorUtils._generate_doubled_tuple(min_value, max_value))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_doubled_tuple(min_value: int, max_value: int) -> Tuple[int, ...]:
+        values = []
         val = 1 if min_value == 0 else min_value
         while val <= max_value:
-            list.append(val)
+            values.append(val)
             val *= 2
-        return list
+        return tuple(values)
@@ -20,6 +20,11 @@
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 from model_analyzer.config.generate.generator_utils import GeneratorUtils
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 
@@ -77,7 +82,7 @@ def _load_config_file(self, file_path):
         """
 
         with open(file_path, "r") as config_file:
-            config = yaml.safe_load(config_file)
+            config = yaml.load(config_file, Loader=SafeLoader)
             return config
 
     def set_config_values(self, args: Namespace) -> None:
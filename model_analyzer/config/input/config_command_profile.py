@@ -27,6 +27,7 @@
 from model_analyzer.config.input.config_utils import (
     binary_path_validator,
     file_path_validator,
+    fraction_validator,
     objective_list_output_mapper,
     parent_path_validator,
 )
@@ -91,6 +92,7 @@
     DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE,
     DEFAULT_RUN_CONFIG_SEARCH_DISABLE,
     DEFAULT_RUN_CONFIG_SEARCH_MODE,
+    DEFAULT_RUN_CONFIG_SEARCH_PRUNING_THRESHOLD,
     DEFAULT_SERVER_OUTPUT_FIELDS,
     DEFAULT_SKIP_DETAILED_REPORTS,
     DEFAULT_SKIP_SUMMARY_REPORTS,
@@ -924,6 +926,15 @@ def _add_run_search_configs(self):
                 description="Maximum number of steps take during the binary concurrency search.",
             )
         )
+        self._add_config(
+            ConfigField(
+                "run_config_search_pruning_threshold",
+                flags=["--run-config-search-pruning-threshold"],
+                field_type=ConfigPrimitive(float, validator=fraction_validator),
+                default_value=DEFAULT_RUN_CONFIG_SEARCH_PRUNING_THRESHOLD,
+                description="Fraction of the best observed throughput that a model's config must reach to be profiled again when brute search revisits it. A value of 0 disables pruning.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "min_percentage_of_search_space",
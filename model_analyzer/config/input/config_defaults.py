@@ -53,6 +53,7 @@
 DEFAULT_RUN_CONFIG_MAX_BINARY_SEARCH_STEPS = 5
 DEFAULT_RUN_CONFIG_SEARCH_DISABLE = False
 DEFAULT_RUN_CONFIG_SEARCH_MODE = "brute"
+DEFAULT_RUN_CONFIG_SEARCH_PRUNING_THRESHOLD = 0.0
 DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE = False
 DEFAULT_OPTUNA_MIN_PERCENTAGE_OF_SEARCH_SPACE = 5
 DEFAULT_OPTUNA_MAX_PERCENTAGE_OF_SEARCH_SPACE = 10
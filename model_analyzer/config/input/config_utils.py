@@ -109,6 +109,30 @@ def file_path_validator(path):
         )
 
 
+def fraction_validator(value):
+    """
+    Used when value must be a fraction
+    between 0 and 1 inclusive.
+
+    Parameters
+    ----------
+    value: float
+        Value of the field
+
+    Returns
+    -------
+    ConfigStatus
+    """
+
+    if 0 <= value <= 1:
+        return ConfigStatus(status=CONFIG_PARSER_SUCCESS)
+    else:
+        return ConfigStatus(
+            status=CONFIG_PARSER_FAILURE,
+            message=f"The value '{value}' must be between 0 and 1.",
+        )
+
+
 ##################
 # Output mappers #
 ##################
@@ -15,60 +15,45 @@
 # limitations under the License.
 
 import argparse
+from copy import deepcopy
 
 import yaml
 
+_BASE_SWEEP_CONFIG = {
+    "run_config_search_disable": True,
+    "perf_analyzer_cpu_util": 600,
+}
 
-def _get_sweep_configs(profile_models):
-    sweep_configs = []
-    model_config = {
-        "run_config_search_disable": True,
-        "perf_analyzer_cpu_util": 600,
-        "profile_models": {
-            model: {
-                "model_config_parameters": {
-                    "instance_group": [{"count": [1, 2, 3, 4], "kind": "KIND_GPU"}]
-                }
-            }
-            for model in profile_models
-        },
-    }
+# Each entry is (model_config_parameters, total_param). total_param is
+# cumulative, since the checkpoint is shared across consecutive runs.
+_SWEEP_TABLE = [
     # total_param=5 because the default config will also be generated
-    model_config["total_param"] = 5
-    sweep_configs.append(model_config)
-
-    model_config = {
-        "run_config_search_disable": True,
-        "perf_analyzer_cpu_util": 600,
-        "profile_models": {
-            model: {
-                "model_config_parameters": {
-                    "dynamic_batching": [{}, None],
-                    "instance_group": [{"count": [1], "kind": ["KIND_GPU", None]}],
-                }
-            }
-            for model in profile_models
-        },
-    }
+    ({"instance_group": [{"count": [1, 2, 3, 4], "kind": "KIND_GPU"}]}, 5),
     # total_param=8 -- 5 from previous run + 5 new configs - 2 matching previous run
-    model_config["total_param"] = 8
-    sweep_configs.append(model_config)
-
-    model_config = {
-        "run_config_search_disable": True,
-        "perf_analyzer_cpu_util": 600,
-        "profile_models": {
-            model: {
-                "model_config_parameters": {
-                    "dynamic_batching": {"max_queue_delay_microseconds": [100, 200]}
-                }
-            }
-            for model in profile_models
+    (
+        {
+            "dynamic_batching": [{}, None],
+            "instance_group": [{"count": [1], "kind": ["KIND_GPU", None]}],
         },
-    }
+        8,
+    ),
     # total_param=10 -- 8 from previous run + 2 new configs
-    model_config["total_param"] = 10
-    sweep_configs.append(model_config)
+    ({"dynamic_batching": {"max_queue_delay_microseconds": [100, 200]}}, 10),
+]
+
+
+def _get_sweep_configs(profile_models):
+    sweep_configs = []
+    for model_config_parameters, total_param in _SWEEP_TABLE:
+        model_config = {
+            **_BASE_SWEEP_CONFIG,
+            "profile_models": {
+                model: {"model_config_parameters": deepcopy(model_config_parameters)}
+                for model in profile_models
+            },
+            "total_param": total_param,
+        }
+        sweep_configs.append(model_config)
     return sweep_configs
 
 
@@ -86,8 +71,7 @@ def _get_sweep_configs(profile_models):
     for i, configuration in enumerate(
         _get_sweep_configs(args.profile_models.split(","))
     ):
-        total_param = configuration["total_param"]
-        del configuration["total_param"]
+        total_param = configuration.pop("total_param")
         with open(f"./config-{i}.yml", "w") as file:
             yaml.dump(configuration, file)
         with open(f"./config-{i}.txt", "w") as file:
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from itertools import product
+from multiprocessing.pool import ThreadPool
 
 import yaml
 
@@ -105,19 +106,24 @@ def get_all_configurations():
     return run_params
 
 
+def _write_configuration(i, configuration):
+    total_param = configuration.pop("total_param")
+    with open(f"./config-{i}.yml", "w") as file:
+        yaml.dump(configuration, file)
+    with open(f"./config-{i}.yml", "r") as file:
+        config = yaml.safe_load(file)
+    with open(f"./config-{i}.txt", "w") as file:
+        file.write(str(total_param))
+
+    with open(f"./config-{i}.models", "w") as file:
+        if isinstance(config["profile_models"], str):
+            file.write(config["profile_models"])
+        else:
+            file.write(",".join(config["profile_models"]))
+
+
 if __name__ == "__main__":
-    for i, configuration in enumerate(get_all_configurations()):
-        total_param = configuration["total_param"]
-        del configuration["total_param"]
-        with open(f"./config-{i}.yml", "w") as file:
-            yaml.dump(configuration, file)
-        with open(f"./config-{i}.yml", "r") as file:
-            config = yaml.safe_load(file)
-        with open(f"./config-{i}.txt", "w") as file:
-            file.write(str(total_param))
-
-        with open(f"./config-{i}.models", "w") as file:
-            if isinstance(config["profile_models"], str):
-                file.write(config["profile_models"])
-            else:
-                file.write(",".join(config["profile_models"]))
+    # Each configuration writes to its own set of files, so they can be
+    # emitted concurrently
+    with ThreadPool(processes=8) as pool:
+        pool.starmap(_write_configuration, enumerate(get_all_configurations()))
@@ -83,10 +83,9 @@ for launch_mode in $TRITON_LAUNCH_MODES; do
             fi
         fi
 
-        NUM_MODELS_OUTPUT_FILE=`echo $config | sed 's/\.yml//'`-models.txt
-        NUM_ROW_OUTPUT_FILE=`echo $config | sed 's/\.yml//'`-param.txt
-        TEST_OUTPUT_NUM_ROWS=`cat $NUM_ROW_OUTPUT_FILE`
-        TEST_MODELS_NUM=`cat $NUM_MODELS_OUTPUT_FILE`
+        META_OUTPUT_FILE=`echo $config | sed 's/\.yml//'`-meta.json
+        TEST_OUTPUT_NUM_ROWS=`jq .total_param $META_OUTPUT_FILE`
+        TEST_MODELS_NUM=`jq .total_models $META_OUTPUT_FILE`
         MODEL_ANALYZER_SUBCOMMAND="profile"
         run_analyzer
         if [ $? -ne 0 ]; then
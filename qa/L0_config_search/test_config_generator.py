@@ -15,9 +15,27 @@
 # limitations under the License.
 
 import argparse
+import json
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# Wide enough that the emitter never folds lines (libyaml needs a C int here)
+_YAML_WIDTH = 2**31 - 1
+
+
+class _ConfigDumper(_Dumper):
+    """
+    The generated configs share no objects, so skip anchor/alias tracking
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
 
 class TestConfigGenerator:
     """
@@ -181,12 +199,18 @@ def _write_file(
         total_models,
         model_config,
     ):
-        with open(f"./config-{self.test_id}-param.txt", "w") as file:
-            file.write(str(total_param))
-        with open(f"./config-{self.test_id}-models.txt", "w") as file:
-            file.write(str(total_models))
+        with open(f"./config-{self.test_id}-meta.json", "w") as file:
+            json.dump({"total_param": total_param, "total_models": total_models}, file)
         with open(f"./config-{self.test_id}.yml", "w") as file:
-            yaml.dump(model_config, file)
+            yaml.dump(
+                model_config,
+                file,
+                Dumper=_ConfigDumper,
+                default_flow_style=False,
+                sort_keys=False,
+                width=_YAML_WIDTH,
+                allow_unicode=True,
+            )
 
 
 if __name__ == "__main__":
@@ -62,12 +62,14 @@ def get_all_configurations():
 
 if __name__ == "__main__":
     for i, configuration in enumerate(get_all_configurations()):
-        total_param_server = configuration["total_param_server"]
-        total_param_gpu = configuration["total_param_gpu"]
-        total_param_inference = configuration["total_param_inference"]
-        del configuration["total_param_server"]
-        del configuration["total_param_gpu"]
-        del configuration["total_param_inference"]
+        total_param_server, total_param_gpu, total_param_inference = (
+            configuration.pop(key)
+            for key in (
+                "total_param_server",
+                "total_param_gpu",
+                "total_param_inference",
+            )
+        )
         with open(f"./config-{i}-param-server.txt", "w") as file:
             file.write(str(total_param_server))
         with open(f"./config-{i}-param-gpu.txt", "w") as file:
@@ -95,6 +95,7 @@ def get_test_options():
         OptionStruct("int", "profile", "--optuna-early-exit-threshold", None, "5", "10"),
         OptionStruct("float", "profile", "--monitoring-interval", "-i", "10.0", "1.0"),
         OptionStruct("float", "profile", "--perf-analyzer-cpu-util", None, "10.0", str(psutil.cpu_count() * 80.0)),
+        OptionStruct("float", "profile", "--run-config-search-pruning-threshold", None, "0.5", "0.0"),
         OptionStruct("int", "profile", "--num-configs-per-model", None, "10", "3"),
         OptionStruct("int", "profile", "--num-top-model-configs", None, "10", "0"),
         OptionStruct("int", "profile", "--latency-budget", None, "200", None),
@@ -2122,6 +2122,44 @@ def test_quick_search_model_specific(self):
         with self.assertRaises(TritonModelAnalyzerException):
             self._evaluate_config(args, yaml_content, subcommand="profile")
 
+    def test_pruning_threshold_range(self):
+        """
+        Test that the run config search pruning threshold must be between 0 and 1
+        """
+        args = [
+            "model-analyzer",
+            "profile",
+            "--model-repository",
+            "cli-repository",
+            "--profile-models",
+            "test_modelA",
+        ]
+
+        yaml_content = ""
+
+        for pruning_threshold in ["0", "0.5", "1"]:
+            self._evaluate_config(
+                args + ["--run-config-search-pruning-threshold", pruning_threshold],
+                yaml_content,
+            )
+
+        for pruning_threshold in ["-0.1", "1.5"]:
+            with self.assertRaises(TritonModelAnalyzerException):
+                self._evaluate_config(
+                    args + ["--run-config-search-pruning-threshold", pruning_threshold],
+                    yaml_content,
+                )
+
+        args += ["-f", "path-to-config-file"]
+
+        for pruning_threshold in ["2", "abc", "[1]"]:
+            yaml_content = f"""
+            run_config_search_pruning_threshold: {pruning_threshold}
+            """
+
+            with self.assertRaises(TritonModelAnalyzerException):
+                self._evaluate_config(args, yaml_content)
+
     def test_model_weightings_profile(self):
         """
         Test that weightings can be specified only per model in the YAML
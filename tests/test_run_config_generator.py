@@ -283,7 +283,9 @@ def test_early_backoff_leaf_model(self):
 
         expected_num_of_configs = 256
 
-        perf_throughput_values = [2**i for i in range(expected_num_of_configs)]
+        perf_throughput_values = self._get_doubling_throughput_values(
+            expected_num_of_configs
+        )
         perf_throughput_values[6] = perf_throughput_values[5]
         perf_throughput_values[7] = perf_throughput_values[5]
 
@@ -331,7 +333,9 @@ def test_early_backoff_root_model(self):
 
         expected_num_of_configs = 196
 
-        perf_throughput_values = [2**i for i in range(expected_num_of_configs)]
+        perf_throughput_values = self._get_doubling_throughput_values(
+            expected_num_of_configs
+        )
         # First 4 is modelA=default, modelB=default
         # Next 32 is modelA max_batch_size=1, modelB=all 16 cases
         # Next 32 is modelA max_batch_size=2, modelB=all 16 cases. We want to change these to show no increase
@@ -396,6 +400,211 @@ def test_measurement_list(self):
                 yaml_str, expected_config_count=expected_num_of_configs
             )
 
+    def test_pruning_threshold(self):
+        """
+        Test that a leaf model config that stayed below the pruning threshold
+        is not profiled again when the root model steps
+
+        Both models are auto search:
+            num_PAC = 1
+            num_MC = 1 * 2 = 2
+
+        default_step = 1
+        total = default_step + modelA_total * modelB_total = 5
+
+        The test sets up the throughput values such that ModelB max_batch_size=2
+        only reaches 1/10th of the best throughput the first time it is profiled.
+        With a pruning threshold of 0.5 it is skipped on the second pass of ModelB
+
+        Thus, actual expected_count = 4
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            run_config_search_max_model_batch_size: 2
+            run_config_search_max_instance_count: 1
+            run_config_search_max_concurrency: 1
+            run_config_search_pruning_threshold: 0.5
+            profile_models:
+                - my-model
+                - my-modelB
+            """)
+
+        perf_throughput_values = [
+            10,     # Default config
+            10, 1,  # A: BS=1  B: BS=1,2
+            10,     # A: BS=2  B: BS=1 (BS=2 is pruned)
+        ]
+        # yapf: enable
+
+        expected_num_of_configs = 4
+
+        with patch.object(
+            TestRunConfigGenerator, "_get_next_perf_throughput_value"
+        ) as mock_method:
+            mock_method.side_effect = perf_throughput_values
+            run_configs = self._run_and_test_run_config_generator(
+                yaml_str, expected_config_count=expected_num_of_configs
+            )
+
+        self.assertEqual(
+            "my-modelB_config_0",
+            run_configs[-1].model_run_configs()[1].model_variant_name(),
+        )
+
+    def test_pruning_threshold_uses_best_throughput(self):
+        """
+        Test that a model config is pruned based on the best throughput across
+        all of its visits, not just the latest one
+
+        Both models are manual search:
+            modelA_total = 3 (max_batch_size: 1,2,4)
+            modelB_total = 2 (max_batch_size: 1,2)
+
+        default_step = 1
+        total = default_step + modelA_total * modelB_total = 7
+
+        ModelB max_batch_size=1 stays below the threshold (0.5 * 100) and is pruned
+        on both later passes. ModelB max_batch_size=2 reaches 100 on its first visit
+        and only 10 on its second, but is still profiled on the third visit
+
+        Thus, actual expected_count = 5
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            run_config_search_max_concurrency: 1
+            run_config_search_pruning_threshold: 0.5
+            profile_models:
+                my-model:
+                    model_config_parameters:
+                        max_batch_size: [1,2,4]
+                my-modelB:
+                    model_config_parameters:
+                        max_batch_size: [1,2]
+            """)
+
+        perf_throughput_values = [
+            10,       # Default config
+            10, 100,  # A: BS=1  B: BS=1,2
+            10,       # A: BS=2  B: BS=2 (BS=1 is pruned)
+            10,       # A: BS=4  B: BS=2 (BS=1 is pruned)
+        ]
+
+        expected_variant_names = [
+            ["my-model_config_default", "my-modelB_config_default"],
+            ["my-model_config_0", "my-modelB_config_0"],
+            ["my-model_config_0", "my-modelB_config_1"],
+            ["my-model_config_1", "my-modelB_config_1"],
+            ["my-model_config_2", "my-modelB_config_1"],
+        ]
+        # yapf: enable
+
+        with patch.object(
+            TestRunConfigGenerator, "_get_next_perf_throughput_value"
+        ) as mock_method:
+            mock_method.side_effect = perf_throughput_values
+            run_configs = self._run_and_test_run_config_generator(
+                yaml_str, expected_config_count=len(expected_variant_names)
+            )
+
+        self.assertEqual(
+            expected_variant_names,
+            [
+                [mrc.model_variant_name() for mrc in rc.model_run_configs()]
+                for rc in run_configs
+            ],
+        )
+
+    def test_pruning_threshold_three_models(self):
+        """
+        Test that pruning a middle model's config skips its entire subtree,
+        and that its earlier measurements are only replayed to its own model
+
+        All models are manual search:
+            model_total = 2 (max_batch_size: 1,2)
+
+        default_step = 1
+        total = default_step + modelA_total * modelB_total * modelC_total = 9
+
+        After ModelB max_batch_size=2 (with ModelC max_batch_size=1) reaches 100:
+            - ModelC max_batch_size=2 (best of 10) is pruned under ModelB max_batch_size=2
+            - ModelB max_batch_size=1 (best of 10) is pruned, along with both
+              of its ModelC configs, on ModelA's second pass
+
+        Thus, actual expected_count = 5
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            run_config_search_max_concurrency: 1
+            run_config_search_pruning_threshold: 0.5
+            profile_models:
+                my-model:
+                    model_config_parameters:
+                        max_batch_size: [1,2]
+                my-modelB:
+                    model_config_parameters:
+                        max_batch_size: [1,2]
+                my-modelC:
+                    model_config_parameters:
+                        max_batch_size: [1,2]
+            """)
+
+        perf_throughput_values = [
+            10,      # Default config
+            10, 10,  # A: BS=1  B: BS=1  C: BS=1,2
+            100,     # A: BS=1  B: BS=2  C: BS=1 (BS=2 is pruned)
+            100,     # A: BS=2  B: BS=2  C: BS=1 (BS=2 is pruned; B: BS=1 is pruned)
+        ]
+
+        expected_variant_names = [
+            ["my-model_config_default", "my-modelB_config_default", "my-modelC_config_default"],
+            ["my-model_config_0", "my-modelB_config_0", "my-modelC_config_0"],
+            ["my-model_config_0", "my-modelB_config_0", "my-modelC_config_1"],
+            ["my-model_config_0", "my-modelB_config_1", "my-modelC_config_0"],
+            ["my-model_config_1", "my-modelB_config_1", "my-modelC_config_0"],
+        ]
+        # yapf: enable
+
+        with patch.object(
+            ModelRunConfigGenerator,
+            "set_last_results",
+            side_effect=ModelRunConfigGenerator.set_last_results,
+            autospec=True,
+        ) as mock_set_last_results:
+            with patch.object(
+                TestRunConfigGenerator, "_get_next_perf_throughput_value"
+            ) as mock_method:
+                mock_method.side_effect = perf_throughput_values
+                run_configs = self._run_and_test_run_config_generator(
+                    yaml_str, expected_config_count=len(expected_variant_names)
+                )
+
+        self.assertEqual(
+            expected_variant_names,
+            [
+                [mrc.model_variant_name() for mrc in rc.model_run_configs()]
+                for rc in run_configs
+            ],
+        )
+
+        model_results = {}
+        for call in mock_set_last_results.call_args_list:
+            model_results.setdefault(call.args[0]._model_name, []).append(
+                [m.get_non_gpu_metric_value("perf_throughput") for m in call.args[1]]
+            )
+
+        # ModelA's second pass only sees the 100 measured under it, not the
+        # results of the pruned configs replayed below it
+        self.assertEqual([[10], [10, 10, 100], [100]], model_results["my-model"])
+
+        # ModelB's pruned max_batch_size=1 gets its earlier results (10, 10)
+        # replayed to its own generator
+        self.assertEqual(
+            [[10], [10, 10], [100], [10, 10], [100]], model_results["my-modelB"]
+        )
+
     def test_matching_triton_server_env(self):
         """
         Test that we don't assert if triton server environments match:
@@ -664,6 +873,7 @@ def _run_and_test_run_config_generator(self, yaml_str, expected_config_count):
 
         self.mock_model_config = MockModelConfig(protobuf)
         self.mock_model_config.start()
+        self.addCleanup(self.mock_model_config.stop)
         config = evaluate_mock_config(args, yaml_str, subcommand="profile")
 
         profile_models = []
@@ -676,12 +886,22 @@ def _run_and_test_run_config_generator(self, yaml_str, expected_config_count):
             config, MagicMock(), profile_models, MagicMock(), ModelVariantNameManager()
         )
 
+        # RunConfigs are compared by representation (computed once per config),
+        # so that structurally identical configs are caught as duplicates
         run_configs = []
+        seen_representations = set()
         for run_config in rcg.get_configs():
+            representation = run_config.representation()
+            self.assertNotIn(
+                representation,
+                seen_representations,
+                f"Duplicate run config generated at index {len(run_configs)}",
+            )
             run_configs.append(run_config)
+            seen_representations.add(representation)
             rcg.set_last_results(self._get_next_fake_results())
 
-        self.assertEqual(expected_config_count, len(set(run_configs)))
+        self.assertEqual(expected_config_count, len(seen_representations))
 
         # Checks that each ModelRunConfig contains the expected number of model_configs
         for run_config in run_configs:
@@ -689,20 +909,28 @@ def _run_and_test_run_config_generator(self, yaml_str, expected_config_count):
                 len(run_config.model_run_configs()), len(config.profile_models)
             )
 
-        self.mock_model_config.stop()
-
         return run_configs
 
-    def setUp(self):
-        # Mock path validation
-        self.mock_os = MockOSMethods(
+    @classmethod
+    def setUpClass(cls):
+        # Mock path validation. The mocked os is identical for every test,
+        # so it is installed once for the whole class
+        cls.mock_os = MockOSMethods(
             mock_paths=["model_analyzer.config.input.config_utils"]
         )
-        self.mock_os.start()
+        cls.mock_os.start()
 
-    def tearDown(self):
-        self.mock_os.stop()
-        patch.stopall()
+    @classmethod
+    def tearDownClass(cls):
+        cls.mock_os.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        # Only perf_throughput is inspected by the generator, so the remaining
+        # measurement fields can share the same placeholders for every result
+        self._fake_model_name = MagicMock()
+        self._fake_pa_params = MagicMock()
+        self._fake_gpu_metric_values = MagicMock()
 
     def _get_next_fake_results(self):
         throughput_value = self._get_next_perf_throughput_value()
@@ -711,15 +939,20 @@ def _get_next_fake_results(self):
 
         if throughput_value is not None:
             measurement = construct_run_config_measurement(
-                model_name=MagicMock(),
+                model_name=self._fake_model_name,
                 model_config_names=["test_config_name"],
-                model_specific_pa_params=MagicMock(),
-                gpu_metric_values=MagicMock(),
+                model_specific_pa_params=self._fake_pa_params,
+                gpu_metric_values=self._fake_gpu_metric_values,
                 non_gpu_metric_values=[{"perf_throughput": throughput_value}],
             )
 
         return [measurement]
 
+    def _get_doubling_throughput_values(self, count):
+        # Python ints are used (rather than a fixed width array) because the
+        # longer sweeps need values well beyond 2**64
+        return [1 << i for i in range(count)]
+
     def _get_next_perf_throughput_value(self):
         self._fake_throughput *= 2
         return self._fake_throughput